@@ -1,9 +1,17 @@
+from __future__ import annotations
+
+import functools
 import math
 import re
-from typing import Union
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Union
 
 import numpy as np
-import pandas as pd
+
+# pandas costs ~100ms+ to import and is only needed for coerce results
+# and the dataframe helpers, so it is imported lazily (see _pandas_na)
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # global suffix lists
@@ -11,18 +19,109 @@ suffixs = dict(
     number=['K', 'M', 'B', 'T', 'Q'],
     filesize=['KB', 'MB', 'GB', 'TB', 'PB'])
 
+# types accepted as numeric, bool excluded below
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
 
-def raise_err(err, errors):
-    """Internal helper func to raise err if 'raise' else pd.NA"""
-    if errors == 'coerce':
-        return pd.NA
-    else:
-        raise err
+# lazily bound pd.NA, see _pandas_na
+_NA = None
+
+
+def _pandas_na():
+    """Resolve and cache pd.NA without a module level pandas import"""
+    global _NA
+
+    if _NA is None:
+        from pandas import NA
+        _NA = NA
+
+    return _NA
+
+
+# precomputed per family, full suffix list and lowercase suffix > power
+_SUFFIX_LIST = {family: [''] + suffs for family, suffs in suffixs.items()}
+_SUFFIX_POWER = {
+    family: {s.lower(): i for i, s in enumerate(suffix_list)}
+    for family, suffix_list in _SUFFIX_LIST.items()}
+
+# smallest value per family that is too large to convert
+_MAX_VALUE = {
+    family: 10 ** (3 * len(suffix_list))
+    for family, suffix_list in _SUFFIX_LIST.items()}
+
+# precomputed per family, int thresholds for bisect and float divisors
+_THRESHOLDS = {
+    family: [10 ** (3 * i) for i in range(1, len(suffix_list) + 1)]
+    for family, suffix_list in _SUFFIX_LIST.items()}
+_DIVISORS = {
+    family: [10.0 ** (3 * i) for i in range(len(suffix_list))]
+    for family, suffix_list in _SUFFIX_LIST.items()}
+
+# float threshold arrays for the vectorized searchsorted lookup
+_THRESHOLDS_ARR = {
+    family: np.array(thresholds, dtype=np.float64)
+    for family, thresholds in _THRESHOLDS.items()}
+
+# full ansi escape codes per color name, built once at import
+_ANSI_PALETTE = {k: f'\033[{color_code}m' for k, color_code in dict(
+    black=30,
+    red=31,
+    green=32,
+    yellow=33,
+    blue=34,
+    cyan=36,
+    white=37,
+    underline=4,
+    reset=0).items()}
+
+# escape codes for the default to_color cycle
+_DEFAULT_CYCLE = tuple(
+    _ANSI_PALETTE[c] for c in ('red', 'green', 'yellow', 'blue'))
+
+# cached float format specs per precision, see _fmt
+_FMT_CACHE = {}
+
+
+def _fmt(prec: int) -> str:
+    """Cached '.{prec}f' format spec, avoids re-parsing per call"""
+    spec = _FMT_CACHE.get(prec)
+
+    if spec is None:
+        spec = f'.{prec}f'
+        _FMT_CACHE[prec] = spec
+
+    return spec
+
+
+# powers of ten for the bit_length based integer log10
+_POW10 = [10 ** i for i in range(22)]
+
+
+def _log10_floor_int(n: int) -> int:
+    """floor(log10(n)) for a positive int without a libm call
+
+    bit_length reads the int size directly, (bits * 1233) >> 12
+    approximates bits * log10(2) and a single exact int compare corrects
+    the off-by-one, so the result is exact for any size of int.
+    """
+    t = (n.bit_length() * 1233) >> 12
+    pow10 = _POW10[t] if t < len(_POW10) else 10 ** t
+    return t - (n < pow10)
 
 
 def is_numeric(val) -> bool:
     """Check if value is float/int"""
-    return issubclass(np.dtype(type(val)).type, np.number)
+    return isinstance(val, _NUMERIC_TYPES) and not isinstance(val, bool)
+
+
+def _ensure_numeric(val) -> None:
+    """Raise the standard TypeError unless val is numeric
+
+    Single shared validator so every entry point does one direct type
+    check and the message is only formatted when raising.
+    """
+    if not (isinstance(val, _NUMERIC_TYPES) and not isinstance(val, bool)):
+        raise TypeError(
+            f'Value must be numeric, not "{type(val)}". Invalid value: "{val}"')
 
 
 def check_family(family: str) -> bool:
@@ -48,10 +147,20 @@ def check_family(family: str) -> bool:
             f'Invalid family: "{family}". Valid options: {list(suffixs)}')
 
 
+@functools.lru_cache(maxsize=64)
+def _suffix_list_cached(
+        family: str,
+        custom_suff: Union[tuple, None],
+        lower: bool) -> tuple:
+    """Cached core of get_suffix, args must be hashable"""
+    suffix_list = ('',) + (custom_suff or tuple(suffixs[family]))
+    return tuple(s.lower() for s in suffix_list) if lower else suffix_list
+
+
 def get_suffix(
         family: str,
         custom_suff: Union[list, None] = None,
-        lower: bool = False) -> list:
+        lower: bool = False) -> tuple:
     """Get suffix list
 
     Parameters
@@ -65,11 +174,146 @@ def get_suffix(
 
     Returns
     -------
-    list
-        List of suffixes
+    tuple
+        Immutable tuple of suffixes, cached per args
+    """
+    return _suffix_list_cached(
+        family, tuple(custom_suff) if custom_suff else None, lower)
+
+
+def _digit_count(n: int) -> int:
+    """Decimal digit count of an int via bit_length, no string pass"""
+    return 1 if n == 0 else _log10_floor_int(abs(n)) + 1
+
+
+# junk chars deleted from to_numeric input in one C pass
+_PURGE = str.maketrans('', '', '#@$ ,_')
+
+# groups of up to 3 chars for to_color digit grouping
+_GROUP3 = re.compile(r'.{1,3}')
+
+# cached powers of ten for _fast_str split points
+_POW10_CACHE = {}
+
+
+def _fast_str(n: int) -> str:
+    """Convert an int to its decimal string, fast for huge values
+
+    CPython's builtin int to str conversion is quadratic in the digit
+    count. Splitting the value in half with divmod and recursing is
+    roughly O(M(d) log d) and much faster once numbers reach hundreds
+    of digits; it also sidesteps the int to str digit limit added in
+    Python 3.11. Small values fall straight through to str().
+    """
+    if n < 0:
+        return '-' + _fast_str(-n)
+
+    # str() is faster until numbers get very large
+    if n.bit_length() <= 2048:
+        return str(n)
+
+    half = (_log10_floor_int(n) + 1) >> 1
+    pow10 = _POW10_CACHE.get(half)
+
+    if pow10 is None:
+        pow10 = 10 ** half
+        _POW10_CACHE[half] = pow10
+
+    q, r = divmod(n, pow10)
+
+    # low half keeps its leading zeros
+    return _fast_str(q) + _fast_str(r).rjust(half, '0')
+
+
+def _make_to_human_fast(family: str):
+    """Build a specialized fast formatter for one builtin family
+
+    The thresholds, divisors, suffixes and error message are closed
+    over at import, so the returned function skips family validation,
+    suffix list building and the currency branch entirely.
+    """
+    thresholds = _THRESHOLDS[family]
+    divisors = _DIVISORS[family]
+    suffix_list = _SUFFIX_LIST[family]
+    max_len = len(suffix_list) - 1
+    err_msg = (
+        f'Number too large for conversion. Maximum order: '
+        f'100e{max_len * 3} ({suffix_list[-1]})')
+
+    def _to_human_fast(n: float, prec: int = 0) -> str:
+        _ensure_numeric(n)
+
+        # NaN sorts past the last threshold, reject it before the
+        # bisect so it can't masquerade as an overflow
+        if math.isnan(n):
+            raise ValueError(
+                'Cannot convert NaN to human readable format')
+
+        idx = bisect_right(thresholds, abs(n))
+
+        if idx > max_len:
+            raise ValueError(err_msg)
+
+        # format() with a cached spec beats a dynamic-precision f-string
+        return format(n / divisors[idx], _fmt(prec)) + suffix_list[idx]
+
+    return _to_human_fast
+
+
+# per family fast paths with their tables baked in at import
+_FAST_IMPL = {family: _make_to_human_fast(family) for family in suffixs}
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_human_cached(
+        n: float,
+        prec: int,
+        family: str,
+        custom_suff: Union[tuple, None],
+        currency: bool,
+        currency_sym: str) -> str:
+    """Pure cached core of to_human
+
+    Repeated values (eg dataframe columns with common buckets) hit the
+    cache and skip log10, division and formatting entirely. Args must be
+    hashable, so custom_suff is a tuple or None.
     """
-    suffix_list = [''] + (custom_suff or suffixs.get(family))
-    return suffix_list if not lower else [s.lower() for s in suffix_list]
+
+    base = 3
+    suffix_list = get_suffix(family, custom_suff)
+    max_len = len(suffix_list) - 1
+
+    # bisect over precomputed thresholds replaces the log10/floor/pow
+    # pipeline for builtin families and is exact near 10**k boundaries
+    if custom_suff is None:
+        idx = bisect_right(_THRESHOLDS[family], abs(n))
+    else:
+        if n == 0:
+            order = 0
+        elif isinstance(n, int):
+            # bit_length trick avoids the float log10 for exact ints
+            order = _log10_floor_int(abs(n))
+        else:
+            order = int(math.log10(abs(n)) // 1)
+
+        idx = int(order / base)
+
+    # check if number is too large for conversion
+    if idx > max_len:
+        raise ValueError(
+            f'Number too large for conversion. Maximum order: '
+            f'100e{max_len * base} ({suffix_list[-1]})')
+
+    if custom_suff is None:
+        number = n / _DIVISORS[family][idx]
+    else:
+        number = n / 10 ** (3 * idx)
+
+    if not family == 'number':
+        currency = False
+
+    return (currency_sym if currency else '') \
+        + format(number, _fmt(prec)) + suffix_list[idx]
 
 
 def to_human(
@@ -115,43 +359,217 @@ def to_human(
     >>> '69.4K'
     """
 
-    # assert correct dtype
-    if not is_numeric(n):
-        err = TypeError(
-            f'Value must be numeric, not "{type(n)}". Invalid value: "{n}"')
-        return raise_err(err, errors)
+    # specialized per-family fast path for the common kw args
+    if custom_suff is None and not currency and errors == 'raise':
+        impl = _FAST_IMPL.get(family)
+
+        if impl is not None:
+            return impl(n, prec)
+
+    # assert correct dtype, coerce short-circuits before the validator
+    if errors == 'coerce' and not is_numeric(n):
+        return _pandas_na()
+
+    _ensure_numeric(n)
 
     # assert family in suffixs
     check_family(family=family)
 
-    # calculate final number and index position for suffix
-    base = 3
-    order = 0 if n == 0 else int(math.log10(abs(n)) // 1)
-    idx = int(order / base)
-    number = n / 10 ** (3 * idx)
+    # same NaN guard as the fast path, the bisect below would read
+    # NaN as an overflow and raise the wrong error
+    if math.isnan(n):
+        if errors == 'coerce':
+            return _pandas_na()
+
+        raise ValueError('Cannot convert NaN to human readable format')
+
+    # coerce too large values against the precomputed bound without
+    # building and discarding the ValueError below
+    if errors == 'coerce' and custom_suff is None \
+            and abs(n) >= _MAX_VALUE[family]:
+        return _pandas_na()
+
+    try:
+        return _to_human_cached(
+            n=n,
+            prec=prec,
+            family=family,
+            custom_suff=tuple(custom_suff) if custom_suff else None,
+            currency=currency,
+            currency_sym=currency_sym)
+    except ValueError:
+        if errors == 'coerce':
+            return _pandas_na()
+
+        raise
+
+
+def to_human_array(
+        arr: np.ndarray,
+        prec: int = 0,
+        family: str = 'number',
+        custom_suff: Union[list, None] = None,
+        currency: bool = False,
+        currency_sym: str = '$',
+        errors: str = 'raise',
+        **kw) -> np.ndarray:
+    """Convert array of numeric values to human readable strings at once
 
-    suffix_list = get_suffix(family, custom_suff)
+    Vectorized version of to_human. Computes order of magnitude, suffix
+    index and scaled values on the whole array with numpy, then formats
+    strings in a single pass. Used by to_pandas to avoid per-cell calls.
 
-    # check if number is too large for conversion
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array of numbers to convert
+    prec : int, optional
+        Decimal precision within string output, by default 0
+    family : str, optional
+        Suffix family, ['number', 'filesize'], default 'number'
+    custom_suff : Union[list, None], optional
+        List of custom suffixes, default None
+    currency : bool, optional
+        Add currency symbol, default False
+    currency_sym : str, optional
+        Currency symbol, default '$'
+    errors : str
+        'raise', 'coerce', default 'raise'
+        If 'raise', then non-numeric or too large values will raise an
+        exception.
+        If 'coerce', then non-numeric or too large values will become
+        pd.NA.
+
+    Returns
+    -------
+    np.ndarray
+        Object array of formatted strings
+
+    Examples
+    --------
+    >>> to_human_array(np.array([4500, 4510000]), prec=1)
+    >>> array(['4.5K', '4.5M'], dtype=object)
+    """
+    # assert family in suffixs
+    check_family(family=family)
+
+    if errors == 'coerce':
+        # coercing conversion, unconvertible entries become NaN here
+        # and pd.NA in the output instead of failing the dtype cast
+        import pandas as pd
+        arr = pd.to_numeric(
+            pd.Series(np.asarray(arr).ravel()),
+            errors='coerce').to_numpy(dtype=np.float64)
+    else:
+        try:
+            arr = np.asarray(arr, dtype=np.float64)
+        except (ValueError, TypeError) as e:
+            # match the scalar TypeError contract instead of leaking
+            # numpy's cast error
+            raise TypeError(f'Value must be numeric: {e}') from None
+
+    # NaN sorts past the last threshold, mask it out so it can't
+    # masquerade as an overflow below
+    invalid = np.isnan(arr)
+
+    if invalid.any():
+        if not errors == 'coerce':
+            raise ValueError(
+                'Cannot convert NaN to human readable format')
+
+        arr = np.where(invalid, 0.0, arr)
+
+    suffix_list = get_suffix(family, custom_suff)
     max_len = len(suffix_list) - 1
 
-    if idx > max_len:
-        err = ValueError(
-            'Number too large for conversion. Maximum order: 100e{e} ({suff})'
-            .format(
-                e=max_len * base,
-                suff=suffix_list[-1]))
+    # one binary search per element over precomputed thresholds replaces
+    # the log10/floor pipeline and handles zeros without masking
+    if custom_suff is None:
+        thresholds = _THRESHOLDS_ARR[family]
+    else:
+        thresholds = np.power(
+            10.0, 3 * np.arange(1, len(suffix_list) + 1))
 
-        return raise_err(err, errors)
+    idx = np.searchsorted(thresholds, np.abs(arr), side='right')
+
+    # check if any number is too large for conversion, one vectorized
+    # mask instead of a per-element exception
+    overflow = idx > max_len
+
+    if overflow.any():
+        if not errors == 'coerce':
+            raise ValueError(
+                f'Number too large for conversion. Maximum order: '
+                f'100e{max_len * 3} ({suffix_list[-1]})')
+
+        # clamp so scaling stays in range, overflow becomes pd.NA below
+        idx = np.minimum(idx, max_len)
+        invalid = invalid | overflow
+
+    scaled = arr * np.power(10.0, -3 * idx)
 
     if not family == 'number':
         currency = False
 
-    return '{currency_sym}{number:.{prec}f}{suffix}'.format(
-        currency_sym=currency_sym if currency else '',
-        number=number,
-        prec=prec,
-        suffix=suffix_list[idx])
+    # format mantissas and append suffixes in C instead of a Python loop
+    mantissas = np.char.mod('%' + _fmt(prec), scaled)
+    out = np.char.add(mantissas, np.take(np.array(suffix_list), idx))
+
+    if currency:
+        out = np.char.add(currency_sym, out)
+
+    out = out.astype(object)
+
+    if invalid.any():
+        out[invalid] = _pandas_na()
+
+    return out
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_numeric_cached(
+        string: str,
+        family: str,
+        custom_suff: Union[tuple, None]) -> float:
+    """Pure cached core of to_numeric
+
+    Repeated strings skip parsing entirely. Args must be hashable, so
+    custom_suff is a tuple or None.
+    """
+
+    # get dict of lowercase suffix > power, precomputed for builtin families
+    if custom_suff is None:
+        suffix_power = _SUFFIX_POWER[family]
+    else:
+        suffix_power = {s.lower(): i + 1 for i, s in enumerate(custom_suff)}
+        suffix_power[''] = 0
+
+    # delete common junk chars (currency symbols, thousands separators)
+    # in one C-level pass so eg '1,200k' parses as 1200k
+    string = string.translate(_PURGE)
+
+    # single pass over string, much faster than regex for short inputs
+    # skip leading symbols, scan digits/decimal, remainder is the suffix
+    i, n = 0, len(string)
+    while i < n and not (string[i].isdigit() or string[i] == '.'):
+        i += 1
+
+    j = i
+    while j < n and (string[j].isdigit() or string[j] == '.'):
+        j += 1
+
+    number = string[i:j]
+    suff = string[j:].lower()
+
+    base = 10 ** 3
+
+    power = suffix_power.get(suff)
+
+    if power is None:
+        raise ValueError(
+            f'Invalid string suffix: "{suff}". Valid options: {list(suffix_power)}')
+
+    return float(number) * (base ** power)
 
 
 def to_numeric(
@@ -189,38 +607,108 @@ def to_numeric(
     if is_numeric(string):
         return float(string)
 
-    # assert type of string
+    # assert type of string, only format the message when raising
     if not isinstance(string, str):
-        err = TypeError(
+        if errors == 'coerce':
+            return _pandas_na()
+
+        raise TypeError(
             f'Input value must be a string or number, not "{type(string)}". Invalid value: "{string}"')
 
-        return raise_err(err, errors)
+    # assert family in suffixs
+    check_family(family=family)
+
+    try:
+        return _to_numeric_cached(
+            string=string,
+            family=family,
+            custom_suff=tuple(custom_suff) if custom_suff else None)
+    except ValueError:
+        if errors == 'coerce':
+            return _pandas_na()
+
+        raise
+
+
+def to_numeric_array(
+        s: pd.Series,
+        family: str = 'number',
+        custom_suff: Union[list, None] = None,
+        errors: str = 'raise',
+        **kw) -> pd.Series:
+    """Convert Series of human readable strings to numeric values at once
 
-    # get rid of symbols before digit
-    string = re.sub(r'^[\D]+', '', string)
+    Vectorized version of to_numeric. Splits number and suffix for the
+    whole column with a single str.extract pass, maps suffixes to powers
+    through a dict and multiplies in numpy. Used by to_pandas to avoid
+    per-cell calls.
+
+    Parameters
+    ----------
+    s : pd.Series
+        Series of human readable strings to convert
+    family : str, optional
+        Suffix family, ['number', 'filesize'], default 'number'
+    custom_suff : Union[list, None], optional
+        List of custom suffixes, default None
+    errors : str
+        'raise', 'coerce', default 'raise'
+        If 'raise', then invalid parsing will raise an exception.
+        If 'coerce', then invalid parsing will return pd.NA.
+
+    Returns
+    -------
+    pd.Series
+        Series of numeric values
+
+    Examples
+    --------
+    >>> to_numeric_array(pd.Series(['1.5M', '220K']))
+    >>> pd.Series([1500000.0, 220000.0])
+    """
+    import pandas as pd
 
     # assert family in suffixs
     check_family(family=family)
 
-    # get suffix list as all lower
-    suffix_list = get_suffix(family, custom_suff, lower=True)
+    # numeric columns pass straight through, same as scalar to_numeric
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype(float)
 
-    # extract suffix as all alphanumeric characters at end of string
-    suff = re.search(r'[a-zA-Z]*$', string, flags=re.IGNORECASE)[0].lower()
+    if custom_suff is None:
+        suffix_power = _SUFFIX_POWER[family]
+    else:
+        suffix_power = {suff.lower(): i + 1
+                        for i, suff in enumerate(custom_suff)}
+        suffix_power[''] = 0
 
-    base = 10 ** 3
+    # delete the same junk chars as the scalar parser so both accept
+    # the same grammar, eg '1,200k' and ' $8 kb '
+    s = s.str.translate(_PURGE)
 
-    if not suff in suffix_list:
-        err = ValueError(
-            f'Invalid string suffix: "{suff}". Valid options: {suffix_list}')
-        return raise_err(err, errors)
+    # one C-level pass to split leading symbols, number and suffix
+    # the first alternative keeps leading-dot numbers like '.5K' intact
+    # instead of letting the lazy prefix swallow the dot
+    extracted = s.str.extract(r'^\D*?(\d*\.?\d+|\d+\.?\d*)([a-zA-Z]*)$')
+    numbers = pd.to_numeric(extracted[0], errors='coerce')
+    powers = extracted[1].str.lower().map(suffix_power)
 
-    power = suffix_list.index(suff)
+    mask = numbers.isna() | powers.isna()
 
-    # extract number from string
-    # pattern = digit one or more times, decimal zero or more, digit zero or more
-    number = re.search(r'\d+\.*\d*', string)[0]
-    return float(number) * (base ** power)
+    if mask.any():
+        if not errors == 'coerce':
+            raise ValueError(
+                f'Invalid string suffix in: {s[mask].tolist()}')
+
+        result = pd.Series(
+            numbers.to_numpy(dtype=np.float64) * np.power(1000.0, powers.to_numpy(dtype=np.float64)),
+            index=s.index, dtype=object)
+        result[mask] = _pandas_na()
+        return result
+
+    return pd.Series(
+        numbers.to_numpy(dtype=np.float64) * np.power(1000.0, powers.to_numpy(dtype=np.float64)),
+        index=s.index)
 
 
 def to_pandas(
@@ -253,6 +741,7 @@ def to_pandas(
     ----------
     >>> to_pandas(df, col_names=['A', 'B', 'C'], transform_type='human')
     """
+    import pandas as pd
 
     if not type(df) == pd.DataFrame:
         raise TypeError(
@@ -266,29 +755,64 @@ def to_pandas(
         raise TypeError(
             'col_names must be of type str or list')
 
+    if isinstance(col_names, str):
+        col_names = [col_names]
+
     if any(not item in df.columns for item in col_names):
         raise ValueError(
             'One or more columns not present in dataframe!')
 
-    # convert transform type to function for df.assign
-    m_funcs = dict(
-        human=to_human,
-        num=to_numeric,
-        color=to_color)
-
-    func = m_funcs.get(transform_type, None)
+    m_types = ('human', 'num', 'color')
 
-    if func is None:
+    if transform_type not in m_types:
         raise ValueError(
-            f'Invalid transform_type. Valid options: {list(m_funcs.keys())}')
-
-    # create dict of eg {column_name: to_human(**kw)} for each col to convert
-    assign_cols = {col: lambda df: df[col].apply(
-        func, **kw) for col in col_names}
+            f'Invalid transform_type. Valid options: {list(m_types)}')
+
+    # vectorized paths convert whole columns at once
+    if transform_type == 'human':
+        assign_cols = {col: to_human_array(
+            df[col].to_numpy(), family=family, **kw) for col in col_names}
+    elif transform_type == 'num':
+        assign_cols = {col: to_numeric_array(
+            df[col], family=family, **kw) for col in col_names}
+    else:
+        assign_cols = {col: to_color_array(
+            df[col].to_numpy(), **kw) for col in col_names}
 
     return df.assign(**assign_cols)
 
 
+def _color_one(number, cycle: tuple) -> str:
+    """Build the colored string for one number with a resolved cycle"""
+
+    # group alignment is known from the digit count before any string
+    # is built, the sign char counts as a digit to match len(str(n))
+    if isinstance(number, int):
+        offset = (_digit_count(number) + (number < 0)) % 3
+        d = _fast_str(number)
+    else:
+        d = str(number)
+        offset = len(d) % 3
+
+    # split any head remainder once, the compiled findall groups the
+    # rest in a single C pass instead of two slicing branches
+    s = ([d[:offset]] if offset else []) + _GROUP3.findall(d[offset:])
+
+    # output size is known up front, fill a pre-sized parts list by index
+    # so neither the list nor the joined string ever reallocates
+    reset = _ANSI_PALETTE['reset']
+    parts = [''] * (3 * len(s))
+    pos = 0
+
+    for i, num in enumerate(s):
+        parts[pos] = cycle[i % len(cycle)]
+        parts[pos + 1] = num
+        parts[pos + 2] = reset
+        pos += 3
+
+    return ''.join(parts)
+
+
 def to_color(
         number: int,
         color: list = None,
@@ -316,40 +840,74 @@ def to_color(
     ----------
     >>> print(to_color(13637373737348738787, ['yellow', 'red']))
     """
-    palette = dict(
-        black=30,
-        red=31,
-        green=32,
-        yellow=33,
-        blue=34,
-        cyan=36,
-        white=37,
-        underline=4,
-        reset=0)
-
-    # create full color codes as a dict comp
-    palette = {k: f'\033[{color_code}m' for k, color_code in palette.items()}
-
-    # print(number)
     if not is_numeric(number):
-        err = TypeError('Input number should be int type')
-        return raise_err(err, errors)
+        if errors == 'coerce':
+            return _pandas_na()
 
-    c = ['red', 'green', 'yellow', 'blue'] if color is None else color
+        raise TypeError('Input number should be int type')
 
-    d = str(number)
-    offset = len(d) % 3
-    if offset != 0:
-        s = [d[0:offset]] + [d[i:i + 3] for i in range(offset, len(d), 3)]
+    # resolve escape codes once per call, precomputed for the default
+    if color is None:
+        cycle = _DEFAULT_CYCLE
     else:
-        s = [d[i:i + 3] for i in range(offset, len(d), 3)]
+        cycle = tuple(_ANSI_PALETTE[c] for c in color)
 
-    ans = ''
+    return _color_one(number, cycle)
 
-    for i, num in enumerate(s):
-        fill = palette[c[i % len(c)]]
-        ans += fill
-        ans += num
-        ans += palette['reset']
 
-    return ans
+def to_color_array(
+        arr: np.ndarray,
+        color: list = None,
+        errors: str = 'raise',
+        **kw) -> np.ndarray:
+    """Color all numbers of an array at once
+
+    Bulk version of to_color. Resolves the color cycle to escape codes
+    once for the whole array instead of per value. Used by to_pandas to
+    avoid per-cell overhead.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Array of integer numbers to be colored
+    color : list, optional
+        List of colors, by default includes 'red', 'green', 'yellow' and 'blue'
+    errors : str, optional
+        'raise' or 'coerce' non numeric values to pd.NA, default 'raise'
+
+    Returns
+    -------
+    np.ndarray
+        Object array of colored string numbers
+
+    Examples
+    ----------
+    >>> to_color_array(np.array([123, 4567]), ['yellow', 'red'])
+    """
+    if color is None:
+        cycle = _DEFAULT_CYCLE
+    else:
+        cycle = tuple(_ANSI_PALETTE[c] for c in color)
+
+    # tolist unboxes numpy scalars to plain ints for _color_one, and
+    # each distinct value is only built once, repeats are dict hits
+    mapping = {}
+    out = []
+
+    for number in np.asarray(arr).tolist():
+        if not is_numeric(number):
+            if not errors == 'coerce':
+                raise TypeError('Input number should be int type')
+
+            out.append(_pandas_na())
+            continue
+
+        colored = mapping.get(number)
+
+        if colored is None:
+            colored = _color_one(number, cycle)
+            mapping[number] = colored
+
+        out.append(colored)
+
+    return np.array(out, dtype=object)
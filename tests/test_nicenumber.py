@@ -50,6 +50,10 @@ def test_to_human():
     # test 'numeric' TypeError raised wth wrong input type
     raises(TypeError, f, n='69420').match('numeric')
 
+    # test NaN raises its own error, not 'too large'
+    raises(ValueError, f, n=float('nan')).match('NaN')
+    raises(ValueError, f, n=float('nan'), custom_suff=['apple']).match('NaN')
+
     # test too large error is raised
     large_vals = [
         dict(n=1e30),
@@ -77,6 +81,43 @@ def test_to_human():
     check_expected_result(func=f, vals=vals)
 
 
+def test_to_human_array():
+    """Test to_human_array function"""
+    f = nn.to_human_array
+
+    # test 'family' ValueError raised with wrong family
+    raises(ValueError, f, arr=np.array([69420]),
+           family='wrong family').match('family')
+
+    # test too large error is raised, or coerced to pd.NA per element
+    raises(ValueError, f, arr=np.array([1.0, 1e30])).match('too large')
+
+    coerced = f(np.array([4500.0, 1e30]), errors='coerce')
+    assert coerced[0] == '4K'
+    assert pd.isnull(coerced[1])
+
+    # test non numeric values coerce to pd.NA instead of raising
+    coerced = f(np.array(['abc', 4500.0], dtype=object), errors='coerce')
+    assert pd.isnull(coerced[0])
+    assert coerced[1] == '4K'
+
+    # test NaN raises its own error, not 'too large'
+    raises(ValueError, f, arr=np.array([np.nan])).match('NaN')
+
+    # test non numeric values raise the standard TypeError
+    raises(TypeError, f, arr=np.array(['abc'], dtype=object)).match('numeric')
+
+    # test array output matches scalar to_human
+    arr = np.array([0, 4500, 4510000, 69420090000])
+    expected = [nn.to_human(n, prec=1) for n in arr.tolist()]
+    assert f(arr, prec=1).tolist() == expected
+
+    # test filesize family and currency
+    assert f(np.array([4510]), prec=2, currency=True).tolist() == ['$4.51K']
+    assert f(np.array([4510000]), prec=2,
+             family='filesize').tolist() == ['4.51MB']
+
+
 def test_to_numeric():
     """Test to_numeric function"""
     f = nn.to_numeric
@@ -106,6 +147,29 @@ def test_to_numeric():
     check_expected_result(func=f, vals=vals)
 
 
+def test_to_numeric_array():
+    """Test to_numeric_array function"""
+    f = nn.to_numeric_array
+
+    # test 'family' ValueError raised with wrong family
+    raises(ValueError, f, s=pd.Series(['1.2K']),
+           family='wrong family').match('family')
+
+    # test invalid suffix raises / coerces
+    raises(ValueError, f, s=pd.Series(['6942klkl'])).match('string')
+    coerced = f(pd.Series(['1.2K', '6942klkl']), errors='coerce')
+    assert coerced[0] == 1200.0
+    assert pd.isnull(coerced[1])
+
+    # test series output matches scalar to_numeric
+    strings = pd.Series(['1.2K', '#@#$220k', '69.420B', '1,200k', '.5K'])
+    expected = [nn.to_numeric(string) for string in strings]
+    assert f(strings).tolist() == expected
+
+    # test numeric series passes through
+    assert f(pd.Series([5, 10])).tolist() == [5.0, 10.0]
+
+
 def test_to_pandas():
     """Test to_pandas function"""
     f = nn.to_pandas
@@ -139,6 +203,25 @@ def test_to_pandas():
     assert df_test.equals(df_num)
 
 
+def test_to_color_array():
+    """Test to_color_array function"""
+    f = nn.to_color_array
+
+    # test array output matches scalar to_color
+    arr = np.array([1, 1234, 123123123])
+    assert f(arr).tolist() == [nn.to_color(n) for n in arr.tolist()]
+
+    # test custom colors are applied
+    assert f(np.array([1]), ['yellow', 'red']).tolist() == ['\x1b[33m1\x1b[0m']
+
+    # test non numeric values raise, or coerce to pd.NA per element
+    raises(TypeError, f, arr=np.array(['abc'], dtype=object)).match('int')
+
+    coerced = f(np.array([1, 'abc'], dtype=object), errors='coerce')
+    assert coerced[0] == nn.to_color(1)
+    assert pd.isnull(coerced[1])
+
+
 def test_to_color():
     """ Test to_color() function"""
 